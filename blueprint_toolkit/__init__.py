@@ -3,55 +3,100 @@
 A package allowing local development of user-defined training blueprints.
 """
 
-from .exceptions import (
-    CheckpointNotFoundError,
-    DatumNotFoundError,
-    ModelNotFoundError,
-    RunContextInterruptedError,
-)
-from .run_context import (
-    RunContext,
-    local_run_context,
-)
-from .progress_saver import (
-    SaveProgressDict,
-    ProgressSaver,
-    MemoryProgressSaver,
-)
-from .metric_saver import (
-    SaveMetricDict,
-    MetricSaver,
-    MemoryMetricSaver,
-)
-from .checkpoint_manager import (
-    CheckpointManager,
-    LocalFileCheckpointManager,
-)
-from .config_loader import (
-    ConfigLoader,
-    FileConfigLoader,
-    MemoryConfigLoader,
-)
-from .model_loader import (
-    ModelLoader,
-    LocalFileModelLoader,
-)
-from .config_types import (
-    DatasetSnapshot,
-    Model,
-    Checkpoint,
-    ModelConfigDict,
-)
-from .s3 import (
-    upload_directory_to_s3,
-    download_directory_from_s3,
-)
-from .dataset import (
-    DatasetFetcher,
-    LocalFileDatasetFetcher,
-    SnapshotDict,
-    DatumMetadataDict,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .exceptions import (
+        CheckpointNotFoundError,
+        DatumNotFoundError,
+        ModelNotFoundError,
+        RunContextInterruptedError,
+    )
+    from .run_context import (
+        RunContext,
+        local_run_context,
+    )
+    from .progress_saver import (
+        SaveProgressDict,
+        ProgressSaver,
+        MemoryProgressSaver,
+    )
+    from .metric_saver import (
+        SaveMetricDict,
+        MetricSaver,
+        MemoryMetricSaver,
+        BufferedMetricSaver,
+    )
+    from .checkpoint_manager import (
+        AggregatedCheckpointReader,
+        AggregatedCheckpointWriter,
+        CheckpointManager,
+        LocalFileCheckpointManager,
+    )
+    from .config_loader import (
+        ConfigLoader,
+        FileConfigLoader,
+        MemoryConfigLoader,
+    )
+    from .model_loader import (
+        ModelLoader,
+        LocalFileModelLoader,
+    )
+    from .config_types import (
+        DatasetSnapshot,
+        Model,
+        Checkpoint,
+        ModelConfigDict,
+    )
+    from .s3 import (
+        upload_directory_to_s3,
+        download_directory_from_s3,
+    )
+    from .dataset import (
+        DatasetFetcher,
+        LocalFileDatasetFetcher,
+        SnapshotDict,
+        DatumMetadataDict,
+    )
+
+# Submodules are imported lazily (PEP 562) so that importing the package does
+# not pay for subsystems the caller never touches — in particular the s3
+# module's boto3 type stack on CLI cold starts.
+_lazy_exports = {
+    "CheckpointNotFoundError": ".exceptions",
+    "DatumNotFoundError": ".exceptions",
+    "ModelNotFoundError": ".exceptions",
+    "RunContextInterruptedError": ".exceptions",
+    "RunContext": ".run_context",
+    "local_run_context": ".run_context",
+    "SaveProgressDict": ".progress_saver",
+    "ProgressSaver": ".progress_saver",
+    "MemoryProgressSaver": ".progress_saver",
+    "SaveMetricDict": ".metric_saver",
+    "MetricSaver": ".metric_saver",
+    "MemoryMetricSaver": ".metric_saver",
+    "BufferedMetricSaver": ".metric_saver",
+    "AggregatedCheckpointReader": ".checkpoint_manager",
+    "AggregatedCheckpointWriter": ".checkpoint_manager",
+    "CheckpointManager": ".checkpoint_manager",
+    "LocalFileCheckpointManager": ".checkpoint_manager",
+    "ConfigLoader": ".config_loader",
+    "FileConfigLoader": ".config_loader",
+    "MemoryConfigLoader": ".config_loader",
+    "ModelLoader": ".model_loader",
+    "LocalFileModelLoader": ".model_loader",
+    "DatasetSnapshot": ".config_types",
+    "Model": ".config_types",
+    "Checkpoint": ".config_types",
+    "ModelConfigDict": ".config_types",
+    "upload_directory_to_s3": ".s3",
+    "download_directory_from_s3": ".s3",
+    "DatasetFetcher": ".dataset",
+    "LocalFileDatasetFetcher": ".dataset",
+    "SnapshotDict": ".dataset",
+    "DatumMetadataDict": ".dataset",
+}
 
 __all__ = [
     "CheckpointNotFoundError",
@@ -66,6 +111,9 @@ __all__ = [
     "SaveMetricDict",
     "MetricSaver",
     "MemoryMetricSaver",
+    "BufferedMetricSaver",
+    "AggregatedCheckpointReader",
+    "AggregatedCheckpointWriter",
     "CheckpointManager",
     "LocalFileCheckpointManager",
     "ConfigLoader",
@@ -84,3 +132,17 @@ __all__ = [
     "SnapshotDict",
     "DatumMetadataDict",
 ]
+
+
+def __getattr__(name: str):
+    submodule = _lazy_exports.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    # Cache so subsequent accesses skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,12 @@
+"""JSON decoding that prefers orjson when it is installed.
+
+orjson decodes several times faster than the stdlib json module; fall back
+to the stdlib so orjson stays an optional dependency.
+"""
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+__all__ = ["loads"]
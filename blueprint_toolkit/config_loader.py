@@ -1,9 +1,10 @@
 """An interface and local implementation for loading training run configurations."""
 
-import json
 from abc import ABC, abstractmethod
 from typing import Any
 
+from ._json import loads
+
 
 class ConfigLoader(ABC):
     """Interface for a class that loads a run's config."""
@@ -53,8 +54,8 @@ class FileConfigLoader(ConfigLoader):
             If the JSON file is invalid and cannot be decoded.
 
         """
-        with open(self.config_path) as f:
-            return json.load(f)
+        with open(self.config_path, "rb") as f:
+            return loads(f.read())
 
 
 class MemoryConfigLoader(ConfigLoader):
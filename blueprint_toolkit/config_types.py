@@ -8,7 +8,7 @@ from typing_extensions import NotRequired
 JSON: TypeAlias = dict[str, "JSON"] | list["JSON"] | str | int | float | bool | None
 
 
-@dataclass
+@dataclass(slots=True)
 class DatasetSnapshot:
     """A config type that specifies a dataset snapshot."""
 
@@ -18,7 +18,7 @@ class DatasetSnapshot:
     """Split of the Chariot dataset snapshot"""
 
 
-@dataclass
+@dataclass(slots=True)
 class Model:
     """A config type that specifies a model."""
 
@@ -26,7 +26,7 @@ class Model:
     """ID of the Chariot model"""
 
 
-@dataclass
+@dataclass(slots=True)
 class Checkpoint:
     """A config type that specifies a training run checkpoint."""
 
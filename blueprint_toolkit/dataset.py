@@ -5,11 +5,25 @@ This module provides a framework-agnostic interface for fetching datasets.
 
 import abc
 import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, TypedDict
 
 from typing_extensions import NotRequired
 
+from ._json import loads
+
+_PARALLEL_READ_THRESHOLD = 64
+"""Number of metadata files above which reads are fanned out to threads."""
+
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+"""Whether the platform supports posix_fadvise read-ahead hints."""
+
+_INDEX_FILE_NAME = ".index.json"
+"""Name of the persisted index file written next to a split's datums."""
+
 
 class DatumMetadataDict(TypedDict):
     """Minimal metadata interface for a datum.
@@ -131,6 +145,16 @@ class LocalFileDatasetFetcher(DatasetFetcher):
         If None, defaults to loading all splits.
     file_root : str | Path, optional
         Root directory of the datums.
+    prefetch_window : int, optional
+        Number of upcoming datum files to hint to the kernel's read-ahead
+        on every fetch, overlapping disk reads with compute for sequential
+        access patterns. Defaults to 0 (no prefetching).
+    pack_datums : bool, optional
+        If True, ``prepare_snapshot_split`` packs each datum and its
+        metadata into a single ``{id}.pkg`` file (written once, next to the
+        originals) and fetches read that one file instead of the separate
+        datum and json files. Halves per-fetch file reads and skips the
+        metadata preload during preparation. Defaults to False.
 
     Raises
     ------
@@ -142,16 +166,23 @@ class LocalFileDatasetFetcher(DatasetFetcher):
     snapshot_id: str
     split: str | None
     file_root: Path
+    prefetch_window: int
+    pack_datums: bool
 
     def __init__(
         self,
         *,
         base_dir: str | Path = ".",
+        prefetch_window: int = 0,
+        pack_datums: bool = False,
     ):
         self.file_root = Path(base_dir).absolute() / "datasets"
         self.file_root.mkdir(parents=True, exist_ok=True)
         self.snapshot_id = ""
         self.split = None
+        self.prefetch_window = prefetch_window
+        self.pack_datums = pack_datums
+        self._last_advised = -1
 
     def prepare_snapshot_split(
         self,
@@ -176,10 +207,73 @@ class LocalFileDatasetFetcher(DatasetFetcher):
 
         file_root = self.file_root / snapshot_id / str(split)
         file_root.mkdir(parents=True, exist_ok=True)
-        self._cached_datum_index_to_id = {
-            i: f.stem for i, f in enumerate(file_root.glob("*.json")) if f.is_file()
+        # A persisted, sorted index makes index-to-datum assignment stable
+        # across processes (required by DataLoaders) and lets later runs skip
+        # the directory scan entirely. Delete the index file to force a
+        # re-scan after adding or removing datums.
+        index_path = file_root / _INDEX_FILE_NAME
+        if index_path.is_file():
+            stems = loads(index_path.read_bytes())
+        else:
+            # One scandir pass builds the index; glob would stat each match
+            # and the is_file check would stat it again, where DirEntry
+            # answers from the directory entry itself.
+            stems = []
+            with os.scandir(file_root) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (
+                        name.endswith(".json")
+                        and not name.startswith(".")
+                        and entry.is_file(follow_symlinks=False)
+                    ):
+                        stems.append(name[:-5])
+            stems.sort()
+            # An empty index could only ever be stale; not persisting it
+            # keeps later prepares re-scanning until datums actually exist.
+            if stems:
+                index_path.write_text(json.dumps(stems))
+        self._cached_datum_index_to_id = dict(enumerate(stems))
+        self._num_datums = len(stems)
+        self._last_advised = -1
+        self._split_root = file_root
+        if self.pack_datums:
+            # Packed fetches carry their metadata, so the preload below is
+            # unnecessary; this also skips N json reads during preparation.
+            self._pack_split(file_root, stems)
+            self._metadata = {}
+        else:
+            # Metadata files are small; parsing them all once here keeps the
+            # json decode out of every get_datum_at_index call.
+            self._metadata = self._load_metadata(file_root)
+
+    def _load_metadata(self, file_root: Path) -> dict[int, Any]:
+        paths = {
+            i: file_root / (stem + ".json")
+            for i, stem in self._cached_datum_index_to_id.items()
         }
-        self._num_datums = len(self._cached_datum_index_to_id)
+        if len(paths) < _PARALLEL_READ_THRESHOLD:
+            return {i: loads(p.read_bytes()) for i, p in paths.items()}
+        # Blocking reads of many small files dominate split preparation; the
+        # threads release the GIL while waiting on disk so reads overlap.
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+            payloads = pool.map(Path.read_bytes, paths.values())
+            return {i: loads(raw) for i, raw in zip(paths, payloads)}
+
+    def _pack_split(self, file_root: Path, stems: list[str]):
+        # Write-once migration: pack each datum and its metadata into one
+        # ``[4-byte json_len][json][datum bytes]`` file. The originals are
+        # left in place so unpacked readers keep working.
+        for stem in stems:
+            pkg_path = file_root / (stem + ".pkg")
+            if pkg_path.exists():
+                continue
+            metadata = (file_root / (stem + ".json")).read_bytes()
+            datum = (file_root / stem).read_bytes()
+            with open(pkg_path, "wb") as f:
+                f.write(len(metadata).to_bytes(4, "little"))
+                f.write(metadata)
+                f.write(datum)
 
     def get_datum_at_index(self, index: int) -> tuple[bytes, Any]:
         """Fetch datum information.
@@ -204,17 +298,54 @@ class LocalFileDatasetFetcher(DatasetFetcher):
             If the datasets service returns an unexpected response
 
         """
-        file_root = self.file_root / self.snapshot_id / str(self.split)
-
-        if index < 0 or index >= self.num_datums:
+        # Read the count attribute directly: the num_datums property would
+        # add a descriptor dispatch to every fetch.
+        num_datums = self._num_datums
+        if index < 0 or index >= num_datums:
             raise ValueError(
                 f"index must be a non-negative integer less than "
-                f"{self.num_datums}. given {index}"
+                f"{num_datums}. given {index}"
             )
-        datum_id = self._cached_datum_index_to_id.get(index)
-        datum_bytes = (file_root / str(datum_id)).read_bytes()
-        datum_dict = json.loads((file_root / (str(datum_id) + ".json")).read_text())
-        return datum_bytes, datum_dict
+        if self.prefetch_window and _HAS_FADVISE:
+            self._advise_prefetch(index)
+        # Bounds were checked above, so subscript directly; ids are already
+        # strings, so no str() coercion is needed either.
+        datum_id = self._cached_datum_index_to_id[index]
+        if self.pack_datums:
+            # One read returns both the datum and its metadata.
+            buf = (self._split_root / (datum_id + ".pkg")).read_bytes()
+            metadata_len = int.from_bytes(buf[:4], "little")
+            metadata = loads(buf[4 : 4 + metadata_len])
+            return buf[4 + metadata_len :], metadata
+        with open(self._split_root / datum_id, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    datum_bytes = bytes(mm)
+            except ValueError:  # an empty file cannot be mapped
+                datum_bytes = b""
+        return datum_bytes, self._metadata[index]
+
+    def _advise_prefetch(self, index: int):
+        # POSIX_FADV_WILLNEED is only a kernel hint, so the whole window can
+        # be advised without any user-space buffering; sequential access
+        # re-advises only the indexes the previous window did not cover.
+        start = max(index + 1, self._last_advised + 1)
+        end = min(index + 1 + self.prefetch_window, self._num_datums)
+        for i in range(start, end):
+            name = self._cached_datum_index_to_id[i]
+            if self.pack_datums:
+                name += ".pkg"
+            path = self._split_root / name
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        if end - 1 > self._last_advised:
+            self._last_advised = end - 1
 
     @property
     def snapshot(self) -> SnapshotDict:
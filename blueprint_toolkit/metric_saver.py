@@ -1,11 +1,21 @@
 """An interface and local implementation for saving training run metrics."""
 
-import math
+import threading
 from abc import ABC, abstractmethod
-from typing import TypedDict
+from collections import deque
+from time import monotonic
+from typing import Any, TypedDict
 
 from .config_types import JSON
 
+try:
+    import numpy as _np
+except ImportError:
+    _np = None  # type: ignore[assignment]
+
+_POSINF = float("inf")
+_NEGINF = float("-inf")
+
 
 class SaveMetricDict(TypedDict):
     """Training run metric."""
@@ -68,25 +78,144 @@ class MemoryMetricSaver(MetricSaver):
         self.metrics.extend(_encode_metrics(metrics))
 
 
+class BufferedMetricSaver(MetricSaver):
+    """Buffers metrics and flushes them to a wrapped saver in batches.
+
+    Training loops often save one metric at a time; buffering coalesces
+    those calls so the wrapped saver sees a few large batches instead of
+    many single-item lists. A flush happens once the buffer reaches
+    ``max_size`` metrics, when a save arrives and the oldest buffered
+    metric is older than ``flush_interval_s``, or when the saver's context
+    exits.
+
+    Parameters
+    ----------
+    metric_saver : MetricSaver
+        The saver that receives the flushed batches.
+    max_size : int, optional
+        Number of buffered metrics that triggers a flush. Defaults to 256.
+    flush_interval_s : float, optional
+        Age in seconds of the oldest buffered metric beyond which the next
+        save triggers a flush. Defaults to 5.0.
+
+    """
+
+    metric_saver: MetricSaver
+    """The wrapped saver that receives flushed batches"""
+    max_size: int
+    """Buffered metric count that triggers a flush"""
+    flush_interval_s: float
+    """Buffered metric age that triggers a flush on the next save"""
+
+    def __init__(
+        self,
+        metric_saver: MetricSaver,
+        max_size: int = 256,
+        flush_interval_s: float = 5.0,
+    ):
+        self.metric_saver = metric_saver
+        self.max_size = max_size
+        self.flush_interval_s = flush_interval_s
+        self._buffer: deque[SaveMetricDict] = deque()
+        self._oldest: float | None = None
+        self._lock = threading.Lock()
+
+    def save_metrics(self, metrics: list[SaveMetricDict]):
+        """Buffer metrics, flushing to the wrapped saver when due.
+
+        Parameters
+        ----------
+        metrics : list[SaveMetricDict]
+            List of metrics to save.
+
+        """
+        with self._lock:
+            self._buffer.extend(metrics)
+            now = monotonic()
+            if self._oldest is None:
+                self._oldest = now
+            if (
+                len(self._buffer) < self.max_size
+                and now - self._oldest < self.flush_interval_s
+            ):
+                return
+            batch = list(self._buffer)
+            self._buffer.clear()
+            self._oldest = None
+        self.metric_saver.save_metrics(metrics=batch)
+
+    def flush(self):
+        """Flush any buffered metrics to the wrapped saver."""
+        with self._lock:
+            if not self._buffer:
+                return
+            batch = list(self._buffer)
+            self._buffer.clear()
+            self._oldest = None
+        self.metric_saver.save_metrics(metrics=batch)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        self.flush()
+
+
 def _encode_metrics(metrics: list[SaveMetricDict]) -> list[SaveMetricDict]:
-    return [
-        {
-            "global_step": m["global_step"],
-            "tag": m["tag"],
-            "value": _encode_nan_and_inf_as_none(m["value"]),
-        }
-        for m in metrics
-    ]
+    # Specialized for the fixed SaveMetricDict schema: the scalar check is
+    # inlined and hot names are bound locally, so encoding a typical metric
+    # costs a few dict operations rather than a function call per value.
+    # NaN is caught by value != value and the infinities by two equality
+    # comparisons, avoiding a math.isfinite call per float.
+    posinf = _POSINF
+    neginf = _NEGINF
+    encode_container = _encode_nan_and_inf_as_none
+    encoded: list[SaveMetricDict] = []
+    append = encoded.append
+    for m in metrics:
+        value = m["value"]
+        t = type(value)
+        if t is float:
+            if value != value or value == posinf or value == neginf:
+                value = None
+        elif not (t is int or t is str or t is bool or value is None):
+            value = encode_container(value)
+        append({"global_step": m["global_step"], "tag": m["tag"], "value": value})
+    return encoded
 
 
 def _encode_nan_and_inf_as_none(o: JSON) -> JSON:
-    if isinstance(o, dict):
-        return {key: _encode_nan_and_inf_as_none(value) for key, value in o.items()}
-    elif isinstance(o, list):
-        return [_encode_nan_and_inf_as_none(element) for element in o]
-    elif isinstance(o, float):
-        if not math.isfinite(o):
-            return None
-        return o
-    else:
-        return o
+    # An explicit work stack replaces recursion, so deeply nested metric
+    # payloads pay no Python call frame per level and cannot hit the
+    # interpreter's recursion limit. Each work item writes its encoded value
+    # into dest[key], where dest is the parent container being rebuilt.
+    root: list[JSON] = [None]
+    stack: list[tuple[Any, Any, Any]] = [(o, root, 0)]
+    while stack:
+        value, dest, key = stack.pop()
+        if isinstance(value, dict):
+            # Children are pushed in reverse so LIFO pops insert keys in
+            # their original order.
+            new_dict: dict[str, JSON] = {}
+            for k, v in reversed(value.items()):
+                stack.append((v, new_dict, k))
+            dest[key] = new_dict
+        elif isinstance(value, list):
+            new_list: list[JSON] = [None] * len(value)
+            for i in range(len(value) - 1, -1, -1):
+                stack.append((value[i], new_list, i))
+            dest[key] = new_list
+        elif isinstance(value, float):
+            if value != value or value == _POSINF or value == _NEGINF:
+                dest[key] = None
+            else:
+                dest[key] = value
+        elif _np is not None and isinstance(value, _np.ndarray):
+            # One vectorized isfinite pass instead of walking per element.
+            if value.dtype.kind == "f":
+                dest[key] = _np.where(_np.isfinite(value), value, None).tolist()
+            else:
+                dest[key] = value.tolist()
+        else:
+            dest[key] = value
+    return root[0]
@@ -9,7 +9,7 @@ from pathlib import Path
 from .exceptions import ModelNotFoundError
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadModelData:
     """Loaded model details."""
 
@@ -6,8 +6,12 @@ progress saving, metric saving, and checkpoint loading and saving.
 """
 
 import logging
+import queue
 import signal
+import sys
+import threading
 from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack, contextmanager
 from typing import Any
 
@@ -29,6 +33,7 @@ from .exceptions import (
     RunContextInterruptedError,
 )
 from .metric_saver import (
+    BufferedMetricSaver,
     MemoryMetricSaver,
     MetricSaver,
     SaveMetricDict,
@@ -44,11 +49,7 @@ from .progress_saver import (
     SaveProgressDict,
 )
 
-logger = logging.getLogger()
-
-
-def _is_context_manager(obj):
-    return hasattr(obj, "__enter__") and hasattr(obj, "__exit__")
+logger = logging.getLogger(__name__)
 
 
 class RunContext:
@@ -70,6 +71,17 @@ class RunContext:
         The ``MetricSaver`` implementation to use.
     checkpoint_manager : CheckpointManager
         The ``CheckpointManager`` implementation to use.
+    async_saves : bool, optional
+        If True, ``save_metrics`` and ``save_progress`` enqueue their
+        payloads and return immediately; a background worker flushes them to
+        the savers in batches. Queued saves are flushed before the context
+        exits. Defaults to False.
+    async_checkpoint : bool, optional
+        If True, ``save_checkpoint`` finalizes checkpoints (fsync, upload —
+        whatever the manager does when its save context exits) on a
+        background thread, so training resumes as soon as the checkpoint
+        directory is populated. Pending finalizations are awaited before
+        the context exits. Defaults to False.
 
     """
 
@@ -87,6 +99,10 @@ class RunContext:
     """Saves metrics"""
     checkpoint_manager: CheckpointManager
     """Manages checkpoints"""
+    async_saves: bool
+    """Whether metric and progress saves are flushed by a background worker"""
+    async_checkpoint: bool
+    """Whether checkpoint finalization runs on a background thread"""
     _exit_stack: ExitStack
     """Exit stack"""
 
@@ -100,13 +116,9 @@ class RunContext:
         progress_saver: ProgressSaver,
         metric_saver: MetricSaver,
         checkpoint_manager: CheckpointManager,
+        async_saves: bool = False,
+        async_checkpoint: bool = False,
     ):
-        def handle_interruption(signum, frame):
-            raise RunContextInterruptedError()
-
-        signal.signal(signal.SIGINT, handle_interruption)
-        signal.signal(signal.SIGTERM, handle_interruption)
-
         self.run_id = run_id
         self.config_loader = config_loader
         self.dataset_fetcher = dataset_fetcher
@@ -114,13 +126,37 @@ class RunContext:
         self.progress_saver = progress_saver
         self.metric_saver = metric_saver
         self.checkpoint_manager = checkpoint_manager
+        self.async_saves = async_saves
+        self.async_checkpoint = async_checkpoint
+        self._save_queue: queue.Queue[Any] | None = None
+        self._save_worker: threading.Thread | None = None
+        self._checkpoint_pool: ThreadPoolExecutor | None = None
+        self._pending_checkpoints: list[Future[Any]] = []
         self._exit_stack = ExitStack()
+        # Deciding once here which components are context managers avoids the
+        # repeated hasattr probes on every __enter__; checking the class also
+        # skips the per-instance attribute lookup.
+        self._cm_components = tuple(
+            component
+            for component in (
+                config_loader,
+                model_loader,
+                progress_saver,
+                metric_saver,
+                checkpoint_manager,
+            )
+            if hasattr(type(component), "__enter__")
+            and hasattr(type(component), "__exit__")
+        )
 
     def __enter__(self):
         """Enter method for context management.
 
-        Enters any context managers associated with the ``config_loader``, ``model_loader``,
-        ``progress_writer``, ``metric_writer``, and ``checkpoint_manager`` into the exit stack.
+        Installs interruption handlers for ``SIGINT`` and ``SIGTERM`` (saving
+        the previous handlers for restoration on exit) and enters any context
+        managers associated with the ``config_loader``, ``model_loader``,
+        ``progress_writer``, ``metric_writer``, and ``checkpoint_manager``
+        into the exit stack.
 
         Returns
         -------
@@ -128,17 +164,25 @@ class RunContext:
             The current instance of the RunContext with entered context managers.
 
         """
+
+        def handle_interruption(signum, frame):
+            raise RunContextInterruptedError()
+
+        # Installing here (rather than in __init__) and restoring on exit
+        # keeps application-level handlers intact outside the context and
+        # stops repeated RunContext construction from clobbering them.
+        self._prev_sigint = signal.signal(signal.SIGINT, handle_interruption)
+        self._prev_sigterm = signal.signal(signal.SIGTERM, handle_interruption)
+
         self._exit_stack.__enter__()
-        if _is_context_manager(self.config_loader):
-            self._exit_stack.enter_context(self.config_loader)  # type: ignore[arg-type]
-        if _is_context_manager(self.model_loader):
-            self._exit_stack.enter_context(self.model_loader)  # type: ignore[arg-type]
-        if _is_context_manager(self.progress_saver):
-            self._exit_stack.enter_context(self.progress_saver)  # type: ignore[arg-type]
-        if _is_context_manager(self.metric_saver):
-            self._exit_stack.enter_context(self.metric_saver)  # type: ignore[arg-type]
-        if _is_context_manager(self.checkpoint_manager):
-            self._exit_stack.enter_context(self.checkpoint_manager)  # type: ignore[arg-type]
+        for component in self._cm_components:
+            self._exit_stack.enter_context(component)
+        if self.async_saves:
+            self._save_queue = queue.Queue()
+            self._save_worker = threading.Thread(
+                target=self._drain_save_queue, daemon=True
+            )
+            self._save_worker.start()
         return self
 
     def __exit__(
@@ -146,7 +190,9 @@ class RunContext:
     ) -> bool | None:
         """Exit method for context management.
 
-        Exits the context stack, ensuring all context managers are properly exited.
+        Restores the signal handlers that were active before the context was
+        entered and exits the context stack, ensuring all context managers
+        are properly exited.
 
         Parameters
         ----------
@@ -165,13 +211,68 @@ class RunContext:
             suppress the exception.
 
         """
-        exit_stack_exit = self._exit_stack.__exit__(
-            exception_type, exception_value, exception_traceback
-        )
+        signal.signal(signal.SIGINT, self._prev_sigint)
+        signal.signal(signal.SIGTERM, self._prev_sigterm)
+        if self._save_queue is not None:
+            # Flush queued saves before the savers themselves exit.
+            self._save_queue.put(None)
+            assert self._save_worker is not None
+            self._save_worker.join()
+            self._save_queue = None
+            self._save_worker = None
+        try:
+            if self._pending_checkpoints:
+                # Checkpoint finalizations must land before the manager
+                # itself exits on the stack below.
+                pending, self._pending_checkpoints = self._pending_checkpoints, []
+                for future in pending:
+                    try:
+                        future.result()
+                    except Exception:
+                        if exception_value is None:
+                            raise
+                        # Don't mask the exception already propagating.
+                        logger.exception("failed to finalize checkpoint")
+        finally:
+            # The stack must unwind even if a finalization failed, or the
+            # entered components (e.g. a buffering metric saver) would never
+            # flush and close.
+            exit_stack_exit = self._exit_stack.__exit__(
+                exception_type, exception_value, exception_traceback
+            )
         if isinstance(exception_value, RunContextInterruptedError):
             return True
         return exit_stack_exit
 
+    def _drain_save_queue(self):
+        assert self._save_queue is not None
+        stopping = False
+        while not stopping:
+            items = [self._save_queue.get()]
+            # Drain whatever queued up behind it so bursts flush as batches.
+            while True:
+                try:
+                    items.append(self._save_queue.get_nowait())
+                except queue.Empty:
+                    break
+            metrics: list[SaveMetricDict] = []
+            progress: list[SaveProgressDict] | None = None
+            for item in items:
+                if item is None:
+                    stopping = True
+                elif item[0] == "metrics":
+                    metrics.extend(item[1])
+                else:
+                    # Progress is a snapshot, so only the latest one matters.
+                    progress = item[1]
+            try:
+                if metrics:
+                    self.metric_saver.save_metrics(metrics=metrics)
+                if progress is not None:
+                    self.progress_saver.save_progress(progress=progress)
+            except Exception:
+                logger.exception("failed to flush queued saves")
+
     def load_config(self) -> dict[Any, Any]:
         """Load a training run configuration.
 
@@ -248,6 +349,9 @@ class RunContext:
            )
 
         """
+        if self._save_queue is not None:
+            self._save_queue.put(("metrics", metrics))
+            return
         self.metric_saver.save_metrics(metrics=metrics)
 
     def save_progress(
@@ -283,6 +387,9 @@ class RunContext:
            )
 
         """
+        if self._save_queue is not None:
+            self._save_queue.put(("progress", progress))
+            return
         self.progress_saver.save_progress(progress=progress)
 
     @contextmanager
@@ -296,6 +403,11 @@ class RunContext:
         exited, all files and directories in the returned path will be saved in a
         checkpoint at the specified global step.
 
+        If the context was created with ``async_checkpoint=True``, the
+        manager's finalization (fsync, upload) runs on a background thread
+        once this context exits cleanly, so training resumes immediately;
+        the ``RunContext`` waits for pending finalizations on exit.
+
         Parameters
         ----------
         global_step : int
@@ -317,10 +429,32 @@ class RunContext:
                 torch.save(optimizer.state_dict(), optimizer_path)
 
         """
-        with self.checkpoint_manager.save_checkpoint(
-            global_step=global_step
-        ) as checkpoint:
+        if not self.async_checkpoint:
+            with self.checkpoint_manager.save_checkpoint(
+                global_step=global_step
+            ) as checkpoint:
+                yield checkpoint
+            return
+        # Enter the manager's save context by hand so that its exit — where
+        # finalization work happens — can be handed to a background thread
+        # instead of blocking training here.
+        cm = self.checkpoint_manager.save_checkpoint(global_step=global_step)
+        checkpoint = cm.__enter__()
+        try:
             yield checkpoint
+        except BaseException:
+            # Failures finalize synchronously so cleanup (e.g. deleting the
+            # partial checkpoint) happens before the error propagates.
+            if not cm.__exit__(*sys.exc_info()):
+                raise
+        else:
+            # A single worker keeps finalizations ordered; a second save
+            # issued while one is still finalizing queues behind it.
+            if self._checkpoint_pool is None:
+                self._checkpoint_pool = ThreadPoolExecutor(max_workers=1)
+            self._pending_checkpoints.append(
+                self._checkpoint_pool.submit(cm.__exit__, None, None, None)
+            )
 
     @contextmanager
     def load_checkpoint(
@@ -369,6 +503,7 @@ def local_run_context(
     config: dict[Any, Any],
     base_dir: str,
     dataset_fetcher: DatasetFetcher | None = None,
+    buffer_metrics: bool = True,
 ) -> RunContext:
     """Return a RunContext manager.
 
@@ -401,18 +536,26 @@ def local_run_context(
     dataset_fetcher: DatasetFetcher | None
         dataset fetcher to retrieve datums and metadata
 
+    buffer_metrics : bool
+        Whether to coalesce metric saves into batches with a
+        ``BufferedMetricSaver`` before they reach the in-memory saver.
+        Buffered metrics are flushed when the run context exits.
+
     Returns
     -------
     RunContext
         Manager for local interactions suitable for testing and development.
 
     """
+    metric_saver: MetricSaver = MemoryMetricSaver()
+    if buffer_metrics:
+        metric_saver = BufferedMetricSaver(metric_saver=metric_saver)
     return RunContext(
         run_id=run_id,
         config_loader=MemoryConfigLoader(config=config),
         dataset_fetcher=dataset_fetcher or LocalFileDatasetFetcher(base_dir=base_dir),
         model_loader=LocalFileModelLoader(base_dir=base_dir),
         progress_saver=MemoryProgressSaver(),
-        metric_saver=MemoryMetricSaver(),
+        metric_saver=metric_saver,
         checkpoint_manager=LocalFileCheckpointManager(run_id=run_id, base_dir=base_dir),
     )